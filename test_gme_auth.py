@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tests for gme_auth.py
+
+Run with:
+    python3 -m unittest test_gme_auth
+    GME_AUTH_BENCH_WALLCLOCK=1 python3 -m unittest test_gme_auth  # also check CLI wall-clock budget
+"""
+
+import os
+import random
+import tempfile
+import time
+import unittest
+
+import gme_auth
+
+
+class TestAuthBuffer(unittest.TestCase):
+
+    def test_generate_verify_round_trip(self):
+        token = gme_auth.generate_auth_buffer_base64("352080", "7868145")
+        parsed = gme_auth.verify_auth_buffer(gme_auth.b64decode(token))
+        self.assertEqual(parsed['version'], 1)
+        self.assertEqual(parsed['user_id'], "352080")
+        self.assertEqual(parsed['room_id'], "7868145")
+        self.assertEqual(parsed['sdk_app_id'], gme_auth.GME_SDK_APP_ID)
+        self.assertEqual(parsed['reserved2'], 0xFFFFFFFF)
+
+
+class TestAuthBufferIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dump_dir = tempfile.TemporaryDirectory()
+        cls.dump_path = os.path.join(cls.dump_dir.name, 'bot.log')
+        rng = random.Random(26)
+        now = int(time.time())
+        cls.expected = []
+        offset = 0
+        with open(cls.dump_path, 'wb') as f:
+            for i in range(600):
+                user, room = str(rng.randint(1, 40)), str(rng.randint(1, 8))
+                if i % 50 == 0:
+                    room = "busy"
+                token = gme_auth.generate_auth_buffer_base64(user, room, expire_time=rng.randint(-600, 600))
+                exp_time = gme_auth.verify_auth_buffer(gme_auth.b64decode(token))['exp_time']
+                if i % 3:
+                    seen_at = now + rng.randint(-300, 300)
+                    stamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seen_at))
+                    prefix = f"[{stamp}.123Z] [bot] sha=deadbeefdeadbeefdeadbeefdeadbeef token="
+                else:
+                    seen_at = 0
+                    prefix = "Auth buffer for /usr/local/share/gme-web-bot/cache: "
+                line = f"{prefix}{token}\n".encode()
+                f.write(line)
+                cls.expected.append({
+                    'user_id': user, 'room_id': room, 'sdk_app_id': gme_auth.GME_SDK_APP_ID,
+                    'exp_time': exp_time, 'seen_at': seen_at, 'offset': offset + len(prefix),
+                })
+                offset += len(line)
+        cls.expected.sort(key=lambda rec: (rec['exp_time'], rec['offset']))
+        cls.now = now
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.dump_dir.cleanup()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.tmp.name, 'bot.gmeidx')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build_from_lines(self, lines):
+        path = os.path.join(self.tmp.name, 'extra.log')
+        with open(path, 'wb') as f:
+            f.write(b''.join(line + b'\n' for line in lines))
+        gme_auth.build_auth_index(path, self.index_path)
+        with gme_auth.AuthBufferIndex(self.index_path) as index:
+            return index.query()
+
+    def brute_force(self, room_id=None, user_id=None, exp_min=None, exp_max=None,
+                    expired_before_use=False):
+        return [
+            rec for rec in self.expected
+            if (room_id is None or rec['room_id'] == room_id)
+            and (user_id is None or rec['user_id'] == user_id)
+            and (exp_min is None or rec['exp_time'] >= exp_min)
+            and (exp_max is None or rec['exp_time'] <= exp_max)
+            and (not expired_before_use or rec['exp_time'] < rec['seen_at'])
+        ]
+
+    def test_query_matches_brute_force(self):
+        count = gme_auth.build_auth_index(self.dump_path, self.index_path)
+        self.assertEqual(count, len(self.expected))
+        self.assertFalse(os.path.exists(self.index_path + '.tmp'))
+        queries = [
+            {},
+            {'room_id': '3'},
+            {'user_id': '7'},
+            {'room_id': 'busy', 'user_id': '7'},
+            {'room_id': '3', 'user_id': '7'},
+            {'exp_min': self.now, 'exp_max': self.now + 100},
+            {'room_id': '5', 'exp_max': self.now},
+            {'user_id': '12', 'exp_min': self.now - 200},
+            {'expired_before_use': True},
+            {'room_id': '2', 'expired_before_use': True},
+            {'room_id': 'missing'},
+            {'exp_min': self.now + 10000},
+        ]
+        with gme_auth.AuthBufferIndex(self.index_path) as index:
+            self.assertEqual(len(index), len(self.expected))
+            for query in queries:
+                with self.subTest(**query):
+                    self.assertEqual(index.query(**query), self.brute_force(**query))
+        self.assertTrue(self.brute_force(expired_before_use=True))
+
+    def test_bad_magic(self):
+        with open(self.index_path, 'wb') as f:
+            f.write(b'junk' * 16)
+        with self.assertRaises(ValueError):
+            gme_auth.AuthBufferIndex(self.index_path)
+
+    def test_short_file(self):
+        for size in (0, 4, 23):
+            with self.subTest(size=size):
+                with open(self.index_path, 'wb') as f:
+                    f.write(b'j' * size)
+                with self.assertRaises(ValueError):
+                    gme_auth.AuthBufferIndex(self.index_path)
+
+    def test_truncated(self):
+        gme_auth.build_auth_index(self.dump_path, self.index_path)
+        with open(self.index_path, 'rb') as f:
+            data = f.read()
+        with open(self.index_path, 'wb') as f:
+            f.write(data[:-3])
+        with self.assertRaises(ValueError):
+            gme_auth.AuthBufferIndex(self.index_path)
+
+    def test_missing_dump_leaves_no_index(self):
+        with self.assertRaises(OSError):
+            gme_auth.build_auth_index(os.path.join(self.tmp.name, 'nope.log'), self.index_path)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_malformed_timestamps(self):
+        token = gme_auth.generate_auth_buffer_base64("352080", "7868145").encode()
+        prefixes = [
+            b'2026-13-45T00:00:00Z ',
+            b'2026-02-30 12:00:00 ',
+            b'1969-12-31T23:59:00Z ',
+            b'0001-01-01 00:00:00 ',
+            b'2200-01-01T00:00:00Z ',
+        ]
+        results = self.build_from_lines([prefix + token for prefix in prefixes])
+        self.assertEqual(len(results), len(prefixes))
+        self.assertEqual({rec['seen_at'] for rec in results}, {0})
+
+    def test_token_in_url_path(self):
+        token = gme_auth.generate_auth_buffer_base64("352080", "7868145").encode()
+        lines = [
+            b'GET https://x/auth/' + token,
+            b'url=/a/' + token,
+            b'/' + token,
+        ]
+        results = self.build_from_lines(lines)
+        self.assertEqual(len(results), len(lines))
+        with open(os.path.join(self.tmp.name, 'extra.log'), 'rb') as f:
+            data = f.read()
+        for rec in results:
+            self.assertEqual(data[rec['offset']:rec['offset'] + len(token)], token)
+            self.assertEqual(rec['room_id'], "7868145")
+
+
+class TestColdStart(unittest.TestCase):
+
+    def test_within_budget(self):
+        result = gme_auth.run_cold_start_benchmark(runs=5)
+        self.assertLessEqual(result['import_us'], result['import_budget_us'])
+        # Wall-clock timing is noisy on shared machines; opt in with GME_AUTH_BENCH_WALLCLOCK=1
+        if os.environ.get('GME_AUTH_BENCH_WALLCLOCK') == '1':
+            self.assertLessEqual(result['cli_overhead_ms'], result['cli_overhead_budget_ms'])
+
+
+if __name__ == "__main__":
+    unittest.main()